@@ -0,0 +1,23 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/FastLZ/fastlz.c" "CMakeFiles/custom-tar.dir/FastLZ/fastlz.c.o" "gcc" "CMakeFiles/custom-tar.dir/FastLZ/fastlz.c.o.d"
+  "/root/package/xxhash.c" "CMakeFiles/custom-tar.dir/xxhash.c.o" "gcc" "CMakeFiles/custom-tar.dir/xxhash.c.o.d"
+  "/root/package/Archive.cpp" "CMakeFiles/custom-tar.dir/Archive.cpp.o" "gcc" "CMakeFiles/custom-tar.dir/Archive.cpp.o.d"
+  "/root/package/main.cpp" "CMakeFiles/custom-tar.dir/main.cpp.o" "gcc" "CMakeFiles/custom-tar.dir/main.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  "/root/package/build/zlib/CMakeFiles/zlibstatic.dir/DependInfo.cmake"
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
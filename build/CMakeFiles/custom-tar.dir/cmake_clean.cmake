@@ -0,0 +1,17 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/custom-tar.dir/Archive.cpp.o"
+  "CMakeFiles/custom-tar.dir/Archive.cpp.o.d"
+  "CMakeFiles/custom-tar.dir/FastLZ/fastlz.c.o"
+  "CMakeFiles/custom-tar.dir/FastLZ/fastlz.c.o.d"
+  "CMakeFiles/custom-tar.dir/main.cpp.o"
+  "CMakeFiles/custom-tar.dir/main.cpp.o.d"
+  "CMakeFiles/custom-tar.dir/xxhash.c.o"
+  "CMakeFiles/custom-tar.dir/xxhash.c.o.d"
+  "bin/custom-tar"
+  "bin/custom-tar.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C CXX)
+  include(CMakeFiles/custom-tar.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
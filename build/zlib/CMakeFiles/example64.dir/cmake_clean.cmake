@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/example64.dir/test/example.c.o"
+  "CMakeFiles/example64.dir/test/example.c.o.d"
+  "example64"
+  "example64.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/example64.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/minigzip.dir/test/minigzip.c.o"
+  "CMakeFiles/minigzip.dir/test/minigzip.c.o.d"
+  "minigzip"
+  "minigzip.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/minigzip.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
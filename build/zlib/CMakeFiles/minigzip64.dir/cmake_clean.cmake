@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/minigzip64.dir/test/minigzip.c.o"
+  "CMakeFiles/minigzip64.dir/test/minigzip.c.o.d"
+  "minigzip64"
+  "minigzip64.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/minigzip64.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
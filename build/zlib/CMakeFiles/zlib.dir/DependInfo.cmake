@@ -0,0 +1,40 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/zlib/adler32.c" "zlib/CMakeFiles/zlib.dir/adler32.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/adler32.c.o.d"
+  "/root/package/zlib/compress.c" "zlib/CMakeFiles/zlib.dir/compress.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/compress.c.o.d"
+  "/root/package/zlib/crc32.c" "zlib/CMakeFiles/zlib.dir/crc32.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/crc32.c.o.d"
+  "/root/package/zlib/deflate.c" "zlib/CMakeFiles/zlib.dir/deflate.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/deflate.c.o.d"
+  "/root/package/zlib/gzclose.c" "zlib/CMakeFiles/zlib.dir/gzclose.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/gzclose.c.o.d"
+  "/root/package/zlib/gzlib.c" "zlib/CMakeFiles/zlib.dir/gzlib.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/gzlib.c.o.d"
+  "/root/package/zlib/gzread.c" "zlib/CMakeFiles/zlib.dir/gzread.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/gzread.c.o.d"
+  "/root/package/zlib/gzwrite.c" "zlib/CMakeFiles/zlib.dir/gzwrite.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/gzwrite.c.o.d"
+  "/root/package/zlib/infback.c" "zlib/CMakeFiles/zlib.dir/infback.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/infback.c.o.d"
+  "/root/package/zlib/inffast.c" "zlib/CMakeFiles/zlib.dir/inffast.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/inffast.c.o.d"
+  "/root/package/zlib/inflate.c" "zlib/CMakeFiles/zlib.dir/inflate.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/inflate.c.o.d"
+  "/root/package/zlib/inftrees.c" "zlib/CMakeFiles/zlib.dir/inftrees.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/inftrees.c.o.d"
+  "/root/package/zlib/trees.c" "zlib/CMakeFiles/zlib.dir/trees.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/trees.c.o.d"
+  "/root/package/zlib/uncompr.c" "zlib/CMakeFiles/zlib.dir/uncompr.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/uncompr.c.o.d"
+  "/root/package/zlib/zutil.c" "zlib/CMakeFiles/zlib.dir/zutil.c.o" "gcc" "zlib/CMakeFiles/zlib.dir/zutil.c.o.d"
+  )
+
+# Pairs of files generated by the same build rule.
+set(CMAKE_MULTIPLE_OUTPUT_PAIRS
+  "/root/package/build/zlib/libz.so" "/root/package/build/zlib/libz.so.1.3.1"
+  "/root/package/build/zlib/libz.so.1" "/root/package/build/zlib/libz.so.1.3.1"
+  )
+
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,41 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/zlib.dir/adler32.c.o"
+  "CMakeFiles/zlib.dir/adler32.c.o.d"
+  "CMakeFiles/zlib.dir/compress.c.o"
+  "CMakeFiles/zlib.dir/compress.c.o.d"
+  "CMakeFiles/zlib.dir/crc32.c.o"
+  "CMakeFiles/zlib.dir/crc32.c.o.d"
+  "CMakeFiles/zlib.dir/deflate.c.o"
+  "CMakeFiles/zlib.dir/deflate.c.o.d"
+  "CMakeFiles/zlib.dir/gzclose.c.o"
+  "CMakeFiles/zlib.dir/gzclose.c.o.d"
+  "CMakeFiles/zlib.dir/gzlib.c.o"
+  "CMakeFiles/zlib.dir/gzlib.c.o.d"
+  "CMakeFiles/zlib.dir/gzread.c.o"
+  "CMakeFiles/zlib.dir/gzread.c.o.d"
+  "CMakeFiles/zlib.dir/gzwrite.c.o"
+  "CMakeFiles/zlib.dir/gzwrite.c.o.d"
+  "CMakeFiles/zlib.dir/infback.c.o"
+  "CMakeFiles/zlib.dir/infback.c.o.d"
+  "CMakeFiles/zlib.dir/inffast.c.o"
+  "CMakeFiles/zlib.dir/inffast.c.o.d"
+  "CMakeFiles/zlib.dir/inflate.c.o"
+  "CMakeFiles/zlib.dir/inflate.c.o.d"
+  "CMakeFiles/zlib.dir/inftrees.c.o"
+  "CMakeFiles/zlib.dir/inftrees.c.o.d"
+  "CMakeFiles/zlib.dir/trees.c.o"
+  "CMakeFiles/zlib.dir/trees.c.o.d"
+  "CMakeFiles/zlib.dir/uncompr.c.o"
+  "CMakeFiles/zlib.dir/uncompr.c.o.d"
+  "CMakeFiles/zlib.dir/zutil.c.o"
+  "CMakeFiles/zlib.dir/zutil.c.o.d"
+  "libz.pdb"
+  "libz.so"
+  "libz.so.1"
+  "libz.so.1.3.1"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/zlib.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
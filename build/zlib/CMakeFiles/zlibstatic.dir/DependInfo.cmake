@@ -0,0 +1,33 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/zlib/adler32.c" "zlib/CMakeFiles/zlibstatic.dir/adler32.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/adler32.c.o.d"
+  "/root/package/zlib/compress.c" "zlib/CMakeFiles/zlibstatic.dir/compress.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/compress.c.o.d"
+  "/root/package/zlib/crc32.c" "zlib/CMakeFiles/zlibstatic.dir/crc32.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/crc32.c.o.d"
+  "/root/package/zlib/deflate.c" "zlib/CMakeFiles/zlibstatic.dir/deflate.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/deflate.c.o.d"
+  "/root/package/zlib/gzclose.c" "zlib/CMakeFiles/zlibstatic.dir/gzclose.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/gzclose.c.o.d"
+  "/root/package/zlib/gzlib.c" "zlib/CMakeFiles/zlibstatic.dir/gzlib.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/gzlib.c.o.d"
+  "/root/package/zlib/gzread.c" "zlib/CMakeFiles/zlibstatic.dir/gzread.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/gzread.c.o.d"
+  "/root/package/zlib/gzwrite.c" "zlib/CMakeFiles/zlibstatic.dir/gzwrite.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/gzwrite.c.o.d"
+  "/root/package/zlib/infback.c" "zlib/CMakeFiles/zlibstatic.dir/infback.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/infback.c.o.d"
+  "/root/package/zlib/inffast.c" "zlib/CMakeFiles/zlibstatic.dir/inffast.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/inffast.c.o.d"
+  "/root/package/zlib/inflate.c" "zlib/CMakeFiles/zlibstatic.dir/inflate.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/inflate.c.o.d"
+  "/root/package/zlib/inftrees.c" "zlib/CMakeFiles/zlibstatic.dir/inftrees.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/inftrees.c.o.d"
+  "/root/package/zlib/trees.c" "zlib/CMakeFiles/zlibstatic.dir/trees.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/trees.c.o.d"
+  "/root/package/zlib/uncompr.c" "zlib/CMakeFiles/zlibstatic.dir/uncompr.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/uncompr.c.o.d"
+  "/root/package/zlib/zutil.c" "zlib/CMakeFiles/zlibstatic.dir/zutil.c.o" "gcc" "zlib/CMakeFiles/zlibstatic.dir/zutil.c.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
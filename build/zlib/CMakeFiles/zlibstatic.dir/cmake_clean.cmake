@@ -0,0 +1,39 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/zlibstatic.dir/adler32.c.o"
+  "CMakeFiles/zlibstatic.dir/adler32.c.o.d"
+  "CMakeFiles/zlibstatic.dir/compress.c.o"
+  "CMakeFiles/zlibstatic.dir/compress.c.o.d"
+  "CMakeFiles/zlibstatic.dir/crc32.c.o"
+  "CMakeFiles/zlibstatic.dir/crc32.c.o.d"
+  "CMakeFiles/zlibstatic.dir/deflate.c.o"
+  "CMakeFiles/zlibstatic.dir/deflate.c.o.d"
+  "CMakeFiles/zlibstatic.dir/gzclose.c.o"
+  "CMakeFiles/zlibstatic.dir/gzclose.c.o.d"
+  "CMakeFiles/zlibstatic.dir/gzlib.c.o"
+  "CMakeFiles/zlibstatic.dir/gzlib.c.o.d"
+  "CMakeFiles/zlibstatic.dir/gzread.c.o"
+  "CMakeFiles/zlibstatic.dir/gzread.c.o.d"
+  "CMakeFiles/zlibstatic.dir/gzwrite.c.o"
+  "CMakeFiles/zlibstatic.dir/gzwrite.c.o.d"
+  "CMakeFiles/zlibstatic.dir/infback.c.o"
+  "CMakeFiles/zlibstatic.dir/infback.c.o.d"
+  "CMakeFiles/zlibstatic.dir/inffast.c.o"
+  "CMakeFiles/zlibstatic.dir/inffast.c.o.d"
+  "CMakeFiles/zlibstatic.dir/inflate.c.o"
+  "CMakeFiles/zlibstatic.dir/inflate.c.o.d"
+  "CMakeFiles/zlibstatic.dir/inftrees.c.o"
+  "CMakeFiles/zlibstatic.dir/inftrees.c.o.d"
+  "CMakeFiles/zlibstatic.dir/trees.c.o"
+  "CMakeFiles/zlibstatic.dir/trees.c.o.d"
+  "CMakeFiles/zlibstatic.dir/uncompr.c.o"
+  "CMakeFiles/zlibstatic.dir/uncompr.c.o.d"
+  "CMakeFiles/zlibstatic.dir/zutil.c.o"
+  "CMakeFiles/zlibstatic.dir/zutil.c.o.d"
+  "libz.a"
+  "libz.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang C)
+  include(CMakeFiles/zlibstatic.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
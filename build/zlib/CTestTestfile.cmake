@@ -0,0 +1,10 @@
+# CMake generated Testfile for 
+# Source directory: /root/package/zlib
+# Build directory: /root/package/build/zlib
+# 
+# This file includes the relevant testing commands required for 
+# testing this directory and lists subdirectories to be tested as well.
+add_test(example "example")
+set_tests_properties(example PROPERTIES  _BACKTRACE_TRIPLES "/root/package/zlib/CMakeLists.txt;203;add_test;/root/package/zlib/CMakeLists.txt;0;")
+add_test(example64 "example64")
+set_tests_properties(example64 PROPERTIES  _BACKTRACE_TRIPLES "/root/package/zlib/CMakeLists.txt;212;add_test;/root/package/zlib/CMakeLists.txt;0;")
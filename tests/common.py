@@ -0,0 +1,78 @@
+"""
+Helpers shared by the custom-tar test modules
+"""
+
+import os
+import hashlib
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# tmpfs directory for scratch files, or None when the system has none
+TMPFS_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+# Worker count for thread pools doing blocking file system calls
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Read buffer size used when hashlib.file_digest is not available
+HASH_CHUNK_SIZE = 64 * 1024
+
+# One read buffer per thread, reused for every file hashed on that thread
+_hash_buffers = threading.local()
+
+def hash_file(f, hasher):
+    """Hashes an open binary file with hasher and returns the hash object"""
+    # file_digest runs the read/update loop in C (Python 3.11+)
+    if hasattr(hashlib, "file_digest"):
+        return hashlib.file_digest(f, hasher)
+    buffer = getattr(_hash_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _hash_buffers.buffer = memoryview(bytearray(HASH_CHUNK_SIZE))
+    file_hash = hasher()
+    while True:
+        size = f.readinto(buffer)
+        if not size:
+            break
+        file_hash.update(buffer[:size])
+    return file_hash
+
+def write_file(path, data, preallocate=False):
+    """Writes bytes to path with a single write() call"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if preallocate and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, len(data))
+            except OSError:
+                # Not every filesystem supports preallocation
+                pass
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+def write_files(paths, payloads):
+    """Writes payloads to paths concurrently; os.open/os.write release the GIL"""
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+        list(executor.map(write_file, paths, payloads))
+
+def walk_files(root):
+    """Yields a DirEntry for every file below root, using the file types reported by scandir"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                # DirEntry reuses the file type from the directory listing, no stat needed
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    yield entry
+
+def remove_tree(path):
+    """Removes a directory tree, using rm -rf where available"""
+    if os.name == "posix":
+        # rm unlinks the whole tree in C without per-entry Python calls
+        subprocess.run(["rm", "-rf", path])
+    # Whatever rm left behind is removed by rmtree, which raises if it cannot
+    if os.path.lexists(path):
+        shutil.rmtree(path)
@@ -8,6 +8,11 @@ import sys
 import os
 from pathlib import Path
 
+try:
+    from unittest_parallel.main import main as unittest_parallel_main
+except ImportError:
+    unittest_parallel_main = None
+
 # Add tests directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -15,6 +20,23 @@ sys.path.insert(0, str(Path(__file__).parent))
 from test_archive import CustomTarTest
 from test_performance import CustomTarPerformanceTest
 
+def run_parallel_tests():
+    """Runs all tests in parallel worker processes using unittest-parallel"""
+    jobs = max(1, (os.cpu_count() or 1) - 2)
+    try:
+        # Class level, because workers running single test cases skip setUpClass;
+        # it also keeps the timed performance tests from competing with each other
+        unittest_parallel_main([
+            "--level=class",
+            "-j", str(jobs),
+            "--buffer",
+            "--verbose",
+            "--start-directory", str(Path(__file__).parent),
+        ])
+    except SystemExit as e:
+        return not e.code
+    return True
+
 def run_all_tests():
     """Runs all tests"""
     
@@ -27,6 +49,10 @@ def run_all_tests():
     
     print("=== CUSTOM-TAR APPLICATION TESTS ===\n")
     
+    # Test classes share no state, so they can run concurrently
+    if unittest_parallel_main is not None:
+        return run_parallel_tests()
+    
     # Create test suite
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
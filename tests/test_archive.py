@@ -9,23 +9,73 @@ import sys
 import subprocess
 import tempfile
 import hashlib
-import shutil
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import unittest
 
+# Helpers shared by the test modules live next to this file
+sys.path.insert(0, str(Path(__file__).parent))
+from common import TMPFS_DIR, hash_file, remove_tree, walk_files, write_file, write_files
+
+# Hashes only compare files within a single run, so prefer the fastest one available
+try:
+    import xxhash
+    _hasher = xxhash.xxh64
+except ImportError:
+    _hasher = hashlib.md5
+
+# Hash of an empty file, returned without opening the file
+EMPTY_FILE_HASH = _hasher().hexdigest()
+
+# Files at least this large are hashed through mmap
+MMAP_HASH_THRESHOLD = 1024 * 1024
+
 class CustomTarTest(unittest.TestCase):
     
-    def setUp(self):
-        """Test environment setup"""
+    @classmethod
+    def setUpClass(cls):
+        """Shared setup: executable path, payloads and prebuilt archive"""
         # Path to executable file
-        self.tar_executable = Path(__file__).parent.parent / "build" / "bin" / "custom-tar"
+        tar_executable = Path(__file__).resolve().parent.parent / "build" / "bin" / "custom-tar"
         
         # Check if executable exists
-        if not self.tar_executable.exists():
-            self.fail(f"Executable not found: {self.tar_executable}")
-        
-        # Create temporary directories
-        self.test_dir = tempfile.mkdtemp()
+        if not tar_executable.exists():
+            raise cls.failureException(f"Executable not found: {tar_executable}")
+        
+        cls.tar_executable = str(tar_executable)
+        
+        # Payload for test_large_files, built once
+        cls.one_mib_payload = b"X" * (1024 * 1024)
+        
+        # Scratch root holding the shared fixture and every test directory,
+        # kept on tmpfs when it is available
+        cls.root_dir = tempfile.mkdtemp(dir=TMPFS_DIR)
+        
+        # Source tree and archive shared by tests that only read them
+        cls.fixture_dir = os.path.join(cls.root_dir, "fixture")
+        cls.fixture_source_dir = os.path.join(cls.fixture_dir, "source")
+        cls.fixture_archive_path = os.path.join(cls.fixture_dir, "test.mtar")
+        os.makedirs(cls.fixture_source_dir)
+        cls.fixture_hashes = cls.create_test_files(cls.fixture_source_dir)
+        
+        cmd = [cls.tar_executable, "create", cls.fixture_archive_path, cls.fixture_source_dir]
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            remove_tree(cls.root_dir)
+            raise cls.failureException(f"Command {' '.join(cmd)} failed with error:\n"
+                                       f"stderr: {result.stderr.decode(errors='replace')}\n"
+                                       f"return code: {result.returncode}")
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Cleanup of all test directories in one pass"""
+        remove_tree(cls.root_dir)
+    
+    def setUp(self):
+        """Test environment setup"""
+        # Create temporary directories, removed together in tearDownClass
+        self.test_dir = tempfile.mkdtemp(dir=self.root_dir)
         self.source_dir = os.path.join(self.test_dir, "source")
         self.extract_dir = os.path.join(self.test_dir, "extracted")
         self.archive_path = os.path.join(self.test_dir, "test.mtar")
@@ -33,89 +83,93 @@ class CustomTarTest(unittest.TestCase):
         os.makedirs(self.source_dir)
         os.makedirs(self.extract_dir)
     
-    def tearDown(self):
-        """Cleanup after tests"""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
-    
-    def create_test_files(self, base_dir):
-        """Creates test file structure"""
-        files_created = []
-        
-        # Create different types of files
+    @staticmethod
+    def create_test_files(base_dir):
+        """Creates test file structure and returns file hashes by relative path"""
+        # Files and their contents, relative to base_dir
         test_files = [
-            ("file1.txt", "Hello World!\nThis is a test file.\n"),
+            ("file1.txt", b"Hello World!\nThis is a test file.\n"),
             ("file2.bin", bytes(range(256))),  # Binary file
-            ("empty.txt", ""),  # Empty file
-            ("large.txt", "A" * 10000),  # Larger text file
+            ("empty.txt", b""),  # Empty file
+            ("large.txt", b"A" * 10000),  # Larger text file
+            # Files in subdirectories
+            (os.path.join("subdir1", "sub1.txt"), b"Content in subdirectory 1"),
+            (os.path.join("subdir1", "sub1.bin"), bytes([1, 2, 3, 4, 5])),
+            (os.path.join("subdir2", "sub2.txt"), b"Content in subdirectory 2"),
+            (os.path.join("subdir2", "duplicate.txt"), b"Hello World!\nThis is a test file.\n"),  # Duplicate
         ]
         
-        for filename, content in test_files:
-            file_path = os.path.join(base_dir, filename)
-            if isinstance(content, str):
-                with open(file_path, 'w') as f:
-                    f.write(content)
-            else:
-                with open(file_path, 'wb') as f:
-                    f.write(content)
-            files_created.append(file_path)
-        
-        # Create directories with files
-        subdir1 = os.path.join(base_dir, "subdir1")
-        subdir2 = os.path.join(base_dir, "subdir2")
-        os.makedirs(subdir1)
-        os.makedirs(subdir2)
-        
-        # Files in subdirectories
-        sub_files = [
-            (os.path.join(subdir1, "sub1.txt"), "Content in subdirectory 1"),
-            (os.path.join(subdir1, "sub1.bin"), bytes([1, 2, 3, 4, 5])),
-            (os.path.join(subdir2, "sub2.txt"), "Content in subdirectory 2"),
-            (os.path.join(subdir2, "duplicate.txt"), "Hello World!\nThis is a test file.\n"),  # Duplicate
-        ]
+        # Create directories before writing files into them
+        for subdir in ("subdir1", "subdir2"):
+            os.makedirs(os.path.join(base_dir, subdir), exist_ok=True)
         
-        for file_path, content in sub_files:
-            if isinstance(content, str):
-                with open(file_path, 'w') as f:
-                    f.write(content)
-            else:
-                with open(file_path, 'wb') as f:
-                    f.write(content)
-            files_created.append(file_path)
+        file_paths = [os.path.join(base_dir, rel_path) for rel_path, _ in test_files]
+        contents = [content for _, content in test_files]
+        write_files(file_paths, contents)
         
-        return files_created
+        # Hash contents already in memory instead of reading the files back
+        return {rel_path: _hasher(content).hexdigest() for rel_path, content in test_files}
     
-    def run_tar_command(self, command, *args):
+    def run_tar_command(self, command, *args, capture_stdout=False):
         """Runs custom-tar command"""
-        cmd = [str(self.tar_executable), command] + list(args)
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return result.stdout, result.stderr
-        except subprocess.CalledProcessError as e:
-            self.fail(f"Command {' '.join(cmd)} failed with error:\n"
-                     f"stdout: {e.stdout}\n"
-                     f"stderr: {e.stderr}\n"
-                     f"return code: {e.returncode}")
+        return self.wait_tar_command(
+            self.run_tar_command_async(command, *args, capture_stdout=capture_stdout))
+    
+    def run_tar_command_async(self, command, *args, capture_stdout=False):
+        """Starts custom-tar command without waiting for it to finish"""
+        cmd = [self.tar_executable, command] + list(args)
+        # Output stays as bytes; stderr is always kept for failure messages
+        stdout = subprocess.PIPE if capture_stdout else subprocess.DEVNULL
+        return subprocess.Popen(cmd, stdout=stdout, stderr=subprocess.PIPE)
+    
+    def wait_tar_command(self, process):
+        """Waits for custom-tar command started by run_tar_command_async"""
+        stdout, stderr = process.communicate()
+        if process.returncode != 0:
+            self.fail(f"Command {' '.join(process.args)} failed with error:\n"
+                     f"stdout: {stdout.decode(errors='replace') if stdout else ''}\n"
+                     f"stderr: {stderr.decode(errors='replace')}\n"
+                     f"return code: {process.returncode}")
+        return stdout, stderr
     
     def calculate_file_hash(self, file_path):
         """Calculates file hash"""
-        hash_md5 = hashlib.md5()
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            file_size = os.stat(file_path).st_size
+            if file_size == 0:
+                return EMPTY_FILE_HASH
+            if file_size >= MMAP_HASH_THRESHOLD:
+                # Large files are hashed straight from the page cache
+                file_hash = _hasher()
+                with open(file_path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    file_hash.update(mm)
+                return file_hash.hexdigest()
+            with open(file_path, "rb", buffering=0) as f:
+                return hash_file(f, _hasher).hexdigest()
         except FileNotFoundError:
             return None
     
+    def list_files(self, directory):
+        """Returns relative paths of all files in directory"""
+        return [os.path.relpath(entry.path, directory) for entry in walk_files(directory)]
+    
     def get_directory_structure(self, directory):
         """Returns directory structure and file hashes"""
-        structure = {}
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                rel_path = os.path.relpath(file_path, directory)
-                structure[rel_path] = self.calculate_file_hash(file_path)
-        return structure
+        rel_paths = self.list_files(directory)
+        file_paths = [os.path.join(directory, rel_path) for rel_path in rel_paths]
+        
+        # File I/O and hashlib release the GIL, so hashing overlaps across threads
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return dict(zip(rel_paths, executor.map(self.calculate_file_hash, file_paths)))
+    
+    def assert_file_equals(self, file_path, expected):
+        """Checks that file exists and contains exactly the expected bytes"""
+        self.assertTrue(os.path.exists(file_path), f"Missing file: {file_path}")
+        self.assertEqual(os.path.getsize(file_path), len(expected), 
+                        f"Size of file {file_path} doesn't match")
+        self.assertEqual(Path(file_path).read_bytes(), expected, 
+                        f"Content of file {file_path} doesn't match")
     
     def test_create_archive(self):
         """Test archive creation"""
@@ -131,39 +185,30 @@ class CustomTarTest(unittest.TestCase):
     
     def test_list_archive(self):
         """Test archive content listing"""
-        # Create files and archive
-        self.create_test_files(self.source_dir)
-        self.run_tar_command("create", self.archive_path, self.source_dir)
+        # List contents of the shared archive
+        stdout, stderr = self.run_tar_command("list", self.fixture_archive_path, capture_stdout=True)
         
-        # List contents
-        stdout, stderr = self.run_tar_command("list", self.archive_path)
+        # Parse the listing once into the set of entry names
+        listed_names = {os.path.basename(token) for token in stdout.split()}
         
         # Check if expected files are in the listing
-        self.assertIn("file1.txt", stdout)
-        self.assertIn("file2.bin", stdout)
-        self.assertIn("subdir1", stdout)
-        self.assertIn("subdir2", stdout)
-        self.assertIn("sub1.txt", stdout)
+        expected_names = {b"file1.txt", b"file2.bin", b"subdir1", b"subdir2", b"sub1.txt"}
+        self.assertTrue(expected_names.issubset(listed_names), 
+                        f"Missing from listing: {expected_names - listed_names}")
     
     def test_extract_archive(self):
         """Test archive extraction"""
-        # Create files and archive
-        original_files = self.create_test_files(self.source_dir)
-        original_structure = self.get_directory_structure(self.source_dir)
-        
-        self.run_tar_command("create", self.archive_path, self.source_dir)
-        
-        # Extract archive
-        self.run_tar_command("extract", self.archive_path, self.extract_dir)
+        # Extract the shared archive
+        self.run_tar_command("extract", self.fixture_archive_path, self.extract_dir)
         
         # Check if files were extracted
         extracted_structure = self.get_directory_structure(self.extract_dir)
         
-        # Compare structures
-        self.assertEqual(len(original_structure), len(extracted_structure), 
+        # Compare with hashes recorded while the source files were written
+        self.assertEqual(len(self.fixture_hashes), len(extracted_structure), 
                         "Number of files doesn't match")
         
-        for rel_path, original_hash in original_structure.items():
+        for rel_path, original_hash in self.fixture_hashes.items():
             self.assertIn(rel_path, extracted_structure, 
                          f"Missing file: {rel_path}")
             self.assertEqual(original_hash, extracted_structure[rel_path], 
@@ -190,13 +235,12 @@ class CustomTarTest(unittest.TestCase):
         """Test archiving large files"""
         # Create large file (1MB)
         large_file = os.path.join(self.source_dir, "large.bin")
-        with open(large_file, "wb") as f:
-            f.write(b"X" * (1024 * 1024))
+        write_file(large_file, self.one_mib_payload, preallocate=True)
         
+        # Archive, hashing the original while custom-tar runs
+        process = self.run_tar_command_async("create", self.archive_path, self.source_dir)
         original_hash = self.calculate_file_hash(large_file)
-        
-        # Archive
-        self.run_tar_command("create", self.archive_path, self.source_dir)
+        self.wait_tar_command(process)
         
         # Extract
         self.run_tar_command("extract", self.archive_path, self.extract_dir)
@@ -213,11 +257,9 @@ class CustomTarTest(unittest.TestCase):
         file1 = os.path.join(self.source_dir, "original.txt")
         file2 = os.path.join(self.source_dir, "duplicate.txt")
         
-        content = "This content is duplicated"
-        with open(file1, 'w') as f:
-            f.write(content)
-        with open(file2, 'w') as f:
-            f.write(content)
+        content = b"This content is duplicated"
+        write_file(file1, content)
+        write_file(file2, content)
         
         # Archive
         self.run_tar_command("create", self.archive_path, self.source_dir)
@@ -226,19 +268,8 @@ class CustomTarTest(unittest.TestCase):
         self.run_tar_command("extract", self.archive_path, self.extract_dir)
         
         # Check if both files exist and have the same content
-        extracted1 = os.path.join(self.extract_dir, "original.txt")
-        extracted2 = os.path.join(self.extract_dir, "duplicate.txt")
-        
-        self.assertTrue(os.path.exists(extracted1))
-        self.assertTrue(os.path.exists(extracted2))
-        
-        with open(extracted1, 'r') as f:
-            content1 = f.read()
-        with open(extracted2, 'r') as f:
-            content2 = f.read()
-        
-        self.assertEqual(content, content1)
-        self.assertEqual(content, content2)
+        self.assert_file_equals(os.path.join(self.extract_dir, "original.txt"), content)
+        self.assert_file_equals(os.path.join(self.extract_dir, "duplicate.txt"), content)
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file